@@ -1,10 +1,18 @@
 from __future__ import absolute_import, print_function, unicode_literals
 from builtins import dict, str
-from copy import deepcopy
+import sys
 import json
 import logging
 import itertools
 import collections
+# Python3
+try:
+    from functools import lru_cache
+# Python2
+except ImportError:
+    from functools32 import lru_cache
+# On Python 2 this import requires the futures backport package
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from indra.statements import *
 from indra.databases import hgnc_client
@@ -13,6 +21,11 @@ from indra.preassembler import Preassembler
 from indra.tools.expand_families import Expander
 from indra.preassembler.hierarchy_manager import hierarchies
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 expander = Expander(hierarchies)
 
 # Python 2
@@ -49,11 +62,14 @@ class CyJSAssembler(object):
         self._edges = []
         self._nodes = []
         self._existing_nodes = {}
-        self._id_counter = 0
+        self._node_index = {}
+        self._id_iter = itertools.count()
         self._exp_colorscale = []
         self._mut_colorscale = []
         self._gene_names = []
         self._context = {}
+        # Statement type -> handler method, filled lazily in make_model
+        self._stmt_handlers = {}
 
     def add_statements(self, stmts):
         """Add INDRA Statements to the assembler's list of statements.
@@ -86,28 +102,49 @@ class CyJSAssembler(object):
             The json serialized Cytoscape JS model.
         """
         for stmt in self.statements:
-            if isinstance(stmt, RegulateActivity):
-                self._add_regulate_activity(stmt)
-            elif isinstance(stmt, RegulateAmount):
-                self._add_regulate_amount(stmt)
-            elif isinstance(stmt, Modification):
-                self._add_modification(stmt)
-            elif isinstance(stmt, SelfModification):
-                self._add_selfmodification(stmt)
-            elif isinstance(stmt, Gef):
-                self._add_gef(stmt)
-            elif isinstance(stmt, Gap):
-                self._add_gap(stmt)
-            elif isinstance(stmt, Complex):
-                self._add_complex(stmt)
+            handler = self._get_stmt_handler(stmt)
+            if handler is not None:
+                handler(stmt)
             else:
                 logger.warning('Unhandled statement type: %s' %
                                stmt.__class__.__name__)
+        self._flatten_uuid_sets()
         if kwargs.get('grouping'):
             self._group_nodes()
             self._group_edges()
         return self.print_cyjs_graph()
 
+    def _get_stmt_handler(self, stmt):
+        """Return the handler method for a Statement, memoized by type.
+
+        The isinstance cascade walks the MRO of the statement class for
+        each check, so its result is cached per concrete type and
+        subsequent statements of the same type dispatch with a single
+        dict lookup.
+        """
+        try:
+            return self._stmt_handlers[type(stmt)]
+        except KeyError:
+            pass
+        if isinstance(stmt, RegulateActivity):
+            handler = self._add_regulate_activity
+        elif isinstance(stmt, RegulateAmount):
+            handler = self._add_regulate_amount
+        elif isinstance(stmt, Modification):
+            handler = self._add_modification
+        elif isinstance(stmt, SelfModification):
+            handler = self._add_selfmodification
+        elif isinstance(stmt, Gef):
+            handler = self._add_gef
+        elif isinstance(stmt, Gap):
+            handler = self._add_gap
+        elif isinstance(stmt, Complex):
+            handler = self._add_complex
+        else:
+            handler = None
+        self._stmt_handlers[type(stmt)] = handler
+        return handler
+
     def get_gene_names(self):
         """Gather gene names of all nodes and node members"""
         # Collect all gene names in network
@@ -126,51 +163,72 @@ class CyJSAssembler(object):
         """Set context of all nodes and node members from CCLE."""
         self.get_gene_names()
 
-        # Get expression and mutations from context client
-        exp_values = \
-            context_client.get_protein_expression(self._gene_names, cell_types)
-        mut_values = \
-            context_client.get_mutations(self._gene_names, cell_types)
+        # Get expression and mutations from the context client in chunks
+        # of cell lines; the chunks are kept small enough to avoid
+        # server-side timeouts and are dispatched concurrently so that the
+        # network round trips overlap
+        chunks = [cell_types[i:i+10] for i in range(0, len(cell_types), 10)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            exp_futures = \
+                [executor.submit(context_client.get_protein_expression,
+                                 self._gene_names, chunk) for chunk in chunks]
+            mut_futures = \
+                [executor.submit(context_client.get_mutations,
+                                 self._gene_names, chunk) for chunk in chunks]
+            # Accumulate each chunk directly into the final result shape
+            # rather than materializing intermediate per-chunk lists
+            exp_values = {}
+            for f in exp_futures:
+                exp_values.update(f.result())
+            mut_values = {}
+            for f in mut_futures:
+                mut_values.update(f.result())
 
         # Make a dict of presence/absence of mutations
         muts = {cell_line: {} for cell_line in cell_types}
         for cell_line, entries in mut_values.items():
             if entries is not None:
-                for gene, mutations in entries.items():
-                    if mutations:
-                        muts[cell_line][gene] = 1
-                    else:
-                        muts[cell_line][gene] = 0
+                muts[cell_line] = {gene: 1 if mutations else 0
+                                   for gene, mutations in entries.items()}
 
         # Create bins for the exp values
         # because colorbrewer only does 3-9 bins and I don't feel like
         # reinventing color scheme theory, this will only bin 3-9 bins
         def bin_exp(expression_dict):
             d = expression_dict
+            # Collect each (cell line, gene) pair along with its value once
+            # so that the log-transform and the bin assignment can be done
+            # in vectorized passes instead of per-value Python loops
+            exp_keys = []
             exp_values = []
+            none_keys = []
             for line in d:
                 for gene in d[line]:
                     val = d[line][gene]
                     if val is not None:
+                        exp_keys.append((line, gene))
                         exp_values.append(val)
-            thr_dict = {}
-            for n_bins in range(3, 10):
-                bin_thr = np.histogram(np.log10(exp_values), n_bins)[1][1:]
-                thr_dict[n_bins] = bin_thr
-            # this dict isn't yet binned, that happens in the loop
-            binned_dict = {x: deepcopy(expression_dict) for x in range(3, 10)}
+                    else:
+                        none_keys.append((line, gene))
+            log_values = np.log10(np.array(exp_values, dtype=np.float64))
+            # Start from empty per-line dicts; every (line, gene) pair is
+            # filled in by the scatter passes below so there is no need to
+            # deep-copy the expression dict for each bin count
+            binned_dict = {x: {line: {} for line in d} for x in range(3, 10)}
             for n_bins in binned_dict:
-                for line in binned_dict[n_bins]:
-                    for gene in binned_dict[n_bins][line]:
-                        # last bin is reserved for None
-                        if binned_dict[n_bins][line][gene] is None:
-                            binned_dict[n_bins][line][gene] = n_bins
-                        else:
-                            val = np.log10(binned_dict[n_bins][line][gene])
-                            for thr_idx, thr in enumerate(thr_dict[n_bins]):
-                                if val <= thr:
-                                    binned_dict[n_bins][line][gene] = thr_idx
-                                    break
+                # Only the bin edges are needed here, so skip the counting
+                # step that np.histogram would also perform
+                bin_thr = np.histogram_bin_edges(log_values, bins=n_bins)[1:]
+                # Find the first bin threshold that each value doesn't
+                # exceed; this is equivalent to a linear scan over the
+                # thresholds but runs as a single binary search pass
+                bin_idx = np.searchsorted(bin_thr, log_values, side='left')
+                d_bin = binned_dict[n_bins]
+                for (line, gene), idx in zip(exp_keys, bin_idx):
+                    d_bin[line][gene] = int(idx)
+                # last bin is reserved for None
+                for line, gene in none_keys:
+                    d_bin[line][gene] = n_bins
             return binned_dict
         binned_exp = bin_exp(exp_values)
 
@@ -178,21 +236,33 @@ class CyJSAssembler(object):
                    'mutation': muts}
         self._context['CCLE'] = context
 
-    def print_cyjs_graph(self):
+    def print_cyjs_graph(self, pretty=False):
         """Return the assembled Cytoscape JS network as a json string.
 
+        Parameters
+        ----------
+        pretty : Optional[bool]
+            If True, the json string is indented with sorted keys for
+            readability. Default: False
+
         Returns
         -------
         cyjs_str : str
             A json string representation of the Cytoscape JS network.
         """
         cyjs_dict = {'edges': self._edges, 'nodes': self._nodes}
-        cyjs_str = json.dumps(cyjs_dict, indent=1, sort_keys=True)
+        cyjs_str = _json_dumps(cyjs_dict, pretty=pretty)
         return cyjs_str
 
-    def print_cyjs_context(self):
+    def print_cyjs_context(self, pretty=False):
         """Return a list of node names and their respective context.
 
+        Parameters
+        ----------
+        pretty : Optional[bool]
+            If True, the json string is indented with sorted keys for
+            readability. Default: False
+
         Returns
         -------
         cyjs_str_context : str
@@ -202,7 +272,7 @@ class CyJSAssembler(object):
             }}
         """
         context = self._context
-        context_str = json.dumps(context, indent=1, sort_keys=True)
+        context_str = _json_dumps(context, pretty=pretty)
         return context_str
 
     def save_json(self, fname_prefix='model'):
@@ -219,14 +289,13 @@ class CyJSAssembler(object):
             context to.
             Default: model
         """
-        cyjs_str = self.print_cyjs_graph()
+        cyjs_dict = {'edges': self._edges, 'nodes': self._nodes}
         # outputs the graph
-        with open(fname_prefix + '.json', 'wb') as fh:
-            fh.write(cyjs_str.encode('utf-8'))
+        with _open_output_file(fname_prefix + '.json') as fh:
+            _json_dump(cyjs_dict, fh)
         # outputs the context of graph nodes
-        context_str = self.print_cyjs_context()
-        with open(fname_prefix + '_context.json', 'wb') as fh:
-            fh.write(context_str.encode('utf-8'))
+        with _open_output_file(fname_prefix + '_context.json') as fh:
+            _json_dump(self._context, fh)
 
     def save_model(self, fname='model.js'):
         """Save the assembled Cytoscape JS network in a js file.
@@ -237,19 +306,15 @@ class CyJSAssembler(object):
             The name of the file to save the Cytoscape JS network to.
             Default: model.js
         """
-        exp_colorscale_str = json.dumps(self._exp_colorscale)
-        mut_colorscale_str = json.dumps(self._mut_colorscale)
         cyjs_dict = {'edges': self._edges, 'nodes': self._nodes}
-        model_str = json.dumps(cyjs_dict, indent=1, sort_keys=True)
-        model_dict = {'exp_colorscale_str': exp_colorscale_str,
-                      'mut_colorscale_str': mut_colorscale_str,
-                      'model_elements_str': model_str}
-        s = ''
-        s += 'var exp_colorscale = %s;\n' % model_dict['exp_colorscale_str']
-        s += 'var mut_colorscale = %s;\n' % model_dict['mut_colorscale_str']
-        s += 'var model_elements = %s;\n' % model_dict['model_elements_str']
-        with open(fname, 'wb') as fh:
-            fh.write(s.encode('utf-8'))
+        with _open_output_file(fname) as fh:
+            fh.write('var exp_colorscale = ')
+            _json_dump(self._exp_colorscale, fh)
+            fh.write(';\nvar mut_colorscale = ')
+            _json_dump(self._mut_colorscale, fh)
+            fh.write(';\nvar model_elements = ')
+            _json_dump(cyjs_dict, fh)
+            fh.write(';\n')
 
     def _add_binary_regulation(self, stmt):
         subj, obj = stmt.agent_list()
@@ -275,9 +340,10 @@ class CyJSAssembler(object):
 
     def _add_complex(self, stmt):
         edge_type, edge_polarity = _get_stmt_type(stmt)
-        for m1, m2 in itertools.combinations(stmt.members, 2):
-            m1_id = self._add_node(m1, uuid=stmt.uuid)
-            m2_id = self._add_node(m2, uuid=stmt.uuid)
+        # Add each member once, then pair up the resulting ids
+        member_ids = [self._add_node(member, uuid=stmt.uuid)
+                      for member in stmt.members]
+        for m1_id, m2_id in itertools.combinations(member_ids, 2):
             self._add_edge(edge_type, m1_id, m2_id, edge_polarity,
                            stmt.uuid)
 
@@ -287,7 +353,7 @@ class CyJSAssembler(object):
         Keyed tuples of (i, source, target, polarity)
         with lists of edge ids [id1, id2, ...]
         """
-        edge_dict = collections.defaultdict(lambda: [])
+        edge_dict = {}
         if len(self._edges) > 0:
             for e in self._edges:
                 data = e['data']
@@ -298,7 +364,6 @@ class CyJSAssembler(object):
 
     def _add_edge(self, edge_type, source, target, edge_polarity, uuid):
         edge_dict = self._get_edge_dict()
-        uuids = collections.defaultdict(lambda: [])
         edge = {'data': {'i': edge_type,
                          'source': source, 'target': target,
                          'polarity': edge_polarity}}
@@ -324,40 +389,42 @@ class CyJSAssembler(object):
         # we must however add its uuid
         if node_id is not None:
             # fetch the appropriate node
-            n = [x for x in self._nodes if x['data']['id'] == node_id][0]
-            uuid_list = n['data']['uuid_list']
-            if uuid not in uuid_list:
-                uuid_list.append(uuid)
+            n = self._node_index[node_id]
+            data = n['data']
+            uuid_set = data.get('uuid_set')
+            # If make_model has already been called, the uuids have been
+            # flattened into a list and need to be promoted back to a set
+            if uuid_set is None:
+                uuid_set = set(data.pop('uuid_list', []))
+                data['uuid_set'] = uuid_set
+            uuid_set.add(uuid)
             return node_id
         db_refs = _get_db_refs(agent)
         node_id = self._get_new_id()
         self._existing_nodes[node_key] = node_id
-        node_name = agent.name
-        node_name = node_name.replace('_', ' ')
-        expanded_families = expander.get_children(agent, ns_filter='HGNC')
+        node_name = agent.name.translate(_underscore_table)
+        expanded_families = _get_expanded_families(agent)
         members = {}
         for member in expanded_families:
             hgnc_symbol = member[1]
-            hgnc_id = hgnc_client.get_hgnc_id(hgnc_symbol)
-            if hgnc_id:
-                up_id = hgnc_client.get_uniprot_id(hgnc_id)
-                member_agent = Agent(hgnc_symbol,
-                                     db_refs={'HGNC': hgnc_id,
-                                              'UP': up_id})
-                member_db_refs = _get_db_refs(member_agent)
-            else:
-                member_db_refs = {}
-            members[member[1]] = {'db_refs': member_db_refs}
+            members[hgnc_symbol] = {'db_refs': _get_member_db_refs(hgnc_symbol)}
         node = {'data': {'id': node_id, 'name': node_name,
                          'db_refs': db_refs, 'parent': '',
-                         'members': members, 'uuid_list': [uuid]}}
+                         'members': members, 'uuid_set': set([uuid])}}
         self._nodes.append(node)
+        self._node_index[node_id] = node
         return node_id
 
+    def _flatten_uuid_sets(self):
+        """Convert the internal uuid sets on nodes to lists for output."""
+        for node in self._nodes:
+            data = node['data']
+            uuid_set = data.pop('uuid_set', None)
+            if uuid_set is not None:
+                data['uuid_list'] = list(uuid_set)
+
     def _get_new_id(self):
-        ret = self._id_counter
-        self._id_counter += 1
-        return ret
+        return next(self._id_iter)
 
     def _get_node_key(self, node_dict_item):
         """Return a tuple of sorted sources and targets given a node dict."""
@@ -389,7 +456,7 @@ class CyJSAssembler(object):
                          edge['data']['target'])
             node_dict[edge['data']['source']]['targets'].append(edge_data)
         # Make a dictionary of nodes based on source/target as a key
-        node_key_dict = collections.defaultdict(lambda: [])
+        node_key_dict = collections.defaultdict(list)
         for node_id, node_d in node_dict.items():
             key = self._get_node_key(node_d)
             node_key_dict[key].append(node_id)
@@ -405,9 +472,15 @@ class CyJSAssembler(object):
         edge to represent all of them.
         """
         # edit edges on parent nodes and make new edges for them
-        edges_to_add = [[], []]  # [group_edges, uuid_lists]
+        edges_to_add = []
+        # Keyed on (i, polarity, source, target) with merged uuid sets as
+        # values, so duplicate group edges are detected with a hash lookup
+        # rather than a linear scan over previously added edges
+        seen_edges = {}
         for e in self._edges:
-            new_edge = deepcopy(e)
+            # Only scalar values are modified on the copy so a shallow
+            # copy of the data dict is sufficient here
+            new_edge = {'data': dict(e['data'])}
             new_edge['data'].pop('id', None)
             uuid_list = new_edge['data'].pop('uuid_list', [])
             # Check if edge source or target are contained in a parent
@@ -415,10 +488,8 @@ class CyJSAssembler(object):
             # Nodes may only point within their container
             source = e['data']['source']
             target = e['data']['target']
-            source_node = [x for x in self._nodes if
-                           x['data']['id'] == source][0]
-            target_node = [x for x in self._nodes if
-                           x['data']['id'] == target][0]
+            source_node = self._node_index[source]
+            target_node = self._node_index[target]
             # If the source node is in a group, we change the source of this
             # edge to the group
             if source_node['data']['parent'] != '':
@@ -430,17 +501,17 @@ class CyJSAssembler(object):
                 new_edge['data']['target'] = target_node['data']['parent']
                 e['data']['i'] = 'Virtual'
             if e['data']['i'] == 'Virtual':
-                if new_edge not in edges_to_add[0]:
-                    edges_to_add[0].append(new_edge)
-                    edges_to_add[1].append(uuid_list)
+                key = (new_edge['data']['i'], new_edge['data']['polarity'],
+                       new_edge['data']['source'], new_edge['data']['target'])
+                uuids = seen_edges.get(key)
+                if uuids is None:
+                    seen_edges[key] = set(uuid_list)
+                    edges_to_add.append((key, new_edge))
                 else:
-                    idx = edges_to_add[0].index(new_edge)
-                    edges_to_add[1][idx] += uuid_list
-                    edges_to_add[1][idx] = list(set(edges_to_add[1][idx]))
-        for ze in zip(*edges_to_add):
-            edge = ze[0]
+                    uuids.update(uuid_list)
+        for key, edge in edges_to_add:
             edge['data']['id'] = self._get_new_id()
-            edge['data']['uuid_list'] = ze[1]
+            edge['data']['uuid_list'] = list(seen_edges[key])
             self._edges.append(edge)
 
     def _group_nodes(self):
@@ -450,17 +521,86 @@ class CyJSAssembler(object):
             new_group_node = {'data': {'id': (self._get_new_id()),
                                        'name': ('Group' + str(group)),
                                        'parent': '', 'uuid_list': []}}
-            member_nodes = [x for x in self._nodes if x['data']['id'] in group]
-            for m_node in member_nodes:
-                new_group_node['data']['uuid_list'] += \
-                    m_node['data']['uuid_list']
-                new_group_node['data']['uuid_list'] = \
-                    list(set(new_group_node['data']['uuid_list']))
-            # Point the node to its parent
-            for node in self._nodes:
-                if node['data']['id'] in group:
-                    node['data']['parent'] = new_group_node['data']['id']
+            group_uuids = set()
+            # Collect member uuids and point each member to its parent
+            for node_id in group:
+                m_node = self._node_index[node_id]
+                group_uuids.update(m_node['data']['uuid_list'])
+                m_node['data']['parent'] = new_group_node['data']['id']
+            new_group_node['data']['uuid_list'] = list(group_uuids)
             self._nodes.append(new_group_node)
+            self._node_index[new_group_node['data']['id']] = new_group_node
+
+
+# Translation table to turn underscores into spaces in node names
+_underscore_table = str.maketrans('_', ' ')
+
+_expanded_families_cache = {}
+
+
+def _get_expanded_families(agent):
+    """Return the HGNC children of an Agent, cached by its grounding.
+
+    Statements mentioning the same family repeat the same hierarchy
+    expansion, so the result is memoized keyed on the Agent's grounding.
+    """
+    key = agent.get_grounding()
+    if key == (None, None):
+        return []
+    children = _expanded_families_cache.get(key)
+    if children is None:
+        children = expander.get_children(agent, ns_filter='HGNC')
+        _expanded_families_cache[key] = children
+    return children
+
+
+@lru_cache(maxsize=100000)
+def _get_member_db_refs(hgnc_symbol):
+    """Return cyjs db_refs for a family member given its HGNC symbol."""
+    hgnc_id = hgnc_client.get_hgnc_id(hgnc_symbol)
+    if not hgnc_id:
+        return {}
+    up_id = hgnc_client.get_uniprot_id(hgnc_id)
+    member_agent = Agent(hgnc_symbol,
+                         db_refs={'HGNC': hgnc_id,
+                                  'UP': up_id})
+    return _get_db_refs(member_agent)
+
+
+def _json_dumps(obj, pretty=False):
+    """Serialize an object to a json string, compactly by default.
+
+    Pretty-printing with sorted keys is only done on request since it is
+    substantially slower and bloats the output for large graphs. The
+    compact path uses orjson if it is available.
+    """
+    if pretty:
+        return json.dumps(obj, indent=1, sort_keys=True)
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj, separators=(',', ':'))
+
+
+def _open_output_file(fname):
+    """Open a file for writing json output on both Python 2 and 3.
+
+    On Python 3 the file is opened in text mode with utf-8 encoding; the
+    encoding argument is not available on Python 2, where json.dump
+    writes encoded strs and therefore needs a binary file handle.
+    """
+    if sys.version_info[0] >= 3:
+        return open(fname, 'w', encoding='utf-8')
+    else:
+        return open(fname, 'wb')
+
+
+def _json_dump(obj, fh):
+    """Serialize an object compactly into an open text-mode file.
+
+    Streaming with json.dump avoids materializing the whole json string
+    in memory before writing, which matters for large networks.
+    """
+    json.dump(obj, fh, separators=(',', ':'))
 
 
 def _get_db_refs(agent):
@@ -488,7 +628,22 @@ def _get_db_refs(agent):
     return cyjs_db_refs
 
 
+# Statement type -> (edge type, edge polarity), extended lazily by
+# _get_stmt_type for subclasses encountered during assembly
+_stmt_type_map = {Complex: ('Complex', 'none'),
+                  Activation: ('Activation', 'positive'),
+                  Inhibition: ('Inhibition', 'negative'),
+                  DecreaseAmount: ('DecreaseAmount', 'negative'),
+                  IncreaseAmount: ('IncreaseAmount', 'positive'),
+                  Gef: ('Gef', 'positive'),
+                  Gap: ('Gap', 'negative')}
+
+
 def _get_stmt_type(stmt):
+    try:
+        return _stmt_type_map[type(stmt)]
+    except KeyError:
+        pass
     if isinstance(stmt, AddModification):
         edge_type = stmt.__class__.__name__
         edge_polarity = 'positive'
@@ -522,4 +677,5 @@ def _get_stmt_type(stmt):
     else:
         edge_type = stmt.__class__.__str__()
         edge_polarity = 'none'
+    _stmt_type_map[type(stmt)] = (edge_type, edge_polarity)
     return edge_type, edge_polarity
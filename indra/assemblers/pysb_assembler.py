@@ -59,11 +59,12 @@ class _BaseAgentSet(object):
 
     def get_create_base_agent(self, agent):
         """Return base agent with given name, creating it if needed."""
+        name = _n(agent.name)
         try:
-            base_agent = self.agents[_n(agent.name)]
+            base_agent = self.agents[name]
         except KeyError:
-            base_agent = _BaseAgent(_n(agent.name))
-            self.agents[_n(agent.name)] = base_agent
+            base_agent = _BaseAgent(name)
+            self.agents[name] = base_agent
 
         # If it's a molecular agent
         if isinstance(agent, ist.Agent):
@@ -290,8 +291,21 @@ def get_mod_site_name(mod_type, residue, position):
 
 # PySB model elements ##################################################
 
+_agent_rule_str_cache = {}
+
+
 def get_agent_rule_str(agent):
-    """Construct a string from an Agent as part of a PySB rule name."""
+    """Construct a string from an Agent as part of a PySB rule name.
+
+    The string is memoized keyed by the Agent's matches_key, which
+    covers all the state that goes into the string, since the same
+    agent state typically recurs across many assembled statements.
+    """
+    cache_key = agent.matches_key()
+    try:
+        return _agent_rule_str_cache[cache_key]
+    except KeyError:
+        pass
     rule_str_list = [_n(agent.name)]
     # If it's a molecular agent
     if isinstance(agent, ist.Agent):
@@ -320,6 +334,7 @@ def get_agent_rule_str(agent):
         if agent.location is not None:
             rule_str_list.append(_n(agent.location))
     rule_str = '_'.join(rule_str_list)
+    _agent_rule_str_cache[cache_key] = rule_str
     return rule_str
 
 
@@ -523,6 +538,27 @@ def get_monomer_pattern(model, agent, extra_fields=None):
     return monomer_pattern
 
 
+def get_cached_monomer_pattern(model, agent, extra_fields=None):
+    """Return a memoized MonomerPattern for an Agent in a given model.
+
+    Assembly pipelines often contain many statements referring to the
+    same Agent state; the constructed pattern is cached on the model,
+    keyed by the Agent's matches_key and the extra fields, so identical
+    patterns are not rebuilt for every statement.
+    """
+    key = (agent.matches_key(),
+           tuple(sorted(extra_fields.items())) if extra_fields else None)
+    try:
+        cache = model._pattern_cache
+    except AttributeError:
+        cache = model._pattern_cache = {}
+    pattern = cache.get(key)
+    if pattern is None:
+        pattern = get_monomer_pattern(model, agent, extra_fields=extra_fields)
+        cache[key] = pattern
+    return pattern
+
+
 def get_site_pattern(agent):
     """Construct a dictionary of Monomer site states from an Agent.
 
@@ -1271,25 +1307,26 @@ def modification_assemble_one_step(stmt, model, agent_set, rate_law=None):
 
     # Remove pre-set activity flag
     enz_pattern = get_monomer_pattern(model, stmt.enz)
-    unmod_site_state = states[mod_condition_name][0]
-    mod_site_state = states[mod_condition_name][1]
+    unmod_site_state, mod_site_state = states[mod_condition_name]
     sub_unmod = get_monomer_pattern(model, stmt.sub,
         extra_fields={mod_site: unmod_site_state})
     sub_mod = get_monomer_pattern(model, stmt.sub,
         extra_fields={mod_site: mod_site_state})
 
 
+    enz_initial = stmt.enz.name[0].lower()
+    sub_initial = stmt.sub.name[0].lower()
     if not rate_law:
-        param_name = 'kf_%s%s_%s' % (stmt.enz.name[0].lower(),
-                                      stmt.sub.name[0].lower(), mod_condition_name)
+        param_name = 'kf_%s%s_%s' % (enz_initial, sub_initial,
+                                     mod_condition_name)
         mod_rate = get_create_parameter(model, param_name, 1e-6)
     elif rate_law == 'michaelis_menten':
         # Parameters
-        param_name = ('Km_' + stmt.enz.name[0].lower() +
-                      stmt.sub.name[0].lower() + '_' + mod_condition_name)
+        param_name = ('Km_' + enz_initial + sub_initial + '_' +
+                      mod_condition_name)
         Km = get_create_parameter(model, param_name, 1e8)
-        param_name = ('kc_' + stmt.enz.name[0].lower() +
-                      stmt.sub.name[0].lower() + '_' + mod_condition_name)
+        param_name = ('kc_' + enz_initial + sub_initial + '_' +
+                      mod_condition_name)
         kcat = get_create_parameter(model, param_name, 100)
 
         # We need an observable for the substrate to use in the rate law
@@ -1339,8 +1376,7 @@ def modification_assemble_two_step(stmt, model, agent_set):
     enz_bs = get_binding_site_name(stmt.enz)
     rule_enz_str = get_agent_rule_str(stmt.enz)
     rule_sub_str = get_agent_rule_str(stmt.sub)
-    unmod_site_state = states[mod_condition_name][0]
-    mod_site_state = states[mod_condition_name][1]
+    unmod_site_state, mod_site_state = states[mod_condition_name]
 
     rule_name = '%s_%s_bind_%s_%s' % \
         (rule_enz_str, mod_condition_name, rule_sub_str, mod_site)
@@ -1584,8 +1620,7 @@ def demodification_assemble_one_step(stmt, model, agent_set, rate_law=None):
                                   stmt.residue, stmt.position)
     enz_pattern = get_monomer_pattern(model, stmt.enz)
 
-    unmod_site_state = states[mod_condition_name][0]
-    mod_site_state = states[mod_condition_name][1]
+    unmod_site_state, mod_site_state = states[mod_condition_name]
     sub_unmod = get_monomer_pattern(model, stmt.sub,
         extra_fields={demod_site: unmod_site_state})
     sub_mod = get_monomer_pattern(model, stmt.sub,
@@ -1650,8 +1685,7 @@ def demodification_assemble_two_step(stmt, model, agent_set):
 
     demod_site = get_mod_site_name(mod_condition_name,
                                   stmt.residue, stmt.position)
-    unmod_site_state = states[mod_condition_name][0]
-    mod_site_state = states[mod_condition_name][1]
+    unmod_site_state, mod_site_state = states[mod_condition_name]
 
     rule_enz_str = get_agent_rule_str(stmt.enz)
     rule_sub_str = get_agent_rule_str(stmt.sub)
@@ -2023,20 +2057,25 @@ def gef_assemble_interactions_only(stmt, model, agent_set):
 
 
 def gef_assemble_one_step(stmt, model, agent_set):
-    gef_pattern = get_monomer_pattern(model, stmt.gef)
-    ras_inactive = get_monomer_pattern(model, stmt.ras,
+    # Build the rule name first: if a rule with this name already exists
+    # in the model, it would be rejected as a duplicate anyway, so we
+    # skip constructing the patterns, parameter and Rule altogether
+    rule_gef_str = get_agent_rule_str(stmt.gef)
+    rule_ras_str = get_agent_rule_str(stmt.ras)
+    rule_name = '%s_activates_%s' % (rule_gef_str, rule_ras_str)
+    if model.rules.get(rule_name) is not None:
+        return
+    gef_pattern = get_cached_monomer_pattern(model, stmt.gef)
+    ras_inactive = get_cached_monomer_pattern(model, stmt.ras,
         extra_fields={'gtpbound': 'inactive'})
-    ras_active = get_monomer_pattern(model, stmt.ras,
+    ras_active = get_cached_monomer_pattern(model, stmt.ras,
         extra_fields={'gtpbound': 'active'})
 
     param_name = 'kf_' + stmt.gef.name[0].lower() + \
                     stmt.ras.name[0].lower() + '_gef'
     kf_gef = get_create_parameter(model, param_name, 1e-6)
 
-    rule_gef_str = get_agent_rule_str(stmt.gef)
-    rule_ras_str = get_agent_rule_str(stmt.ras)
-    r = Rule('%s_activates_%s' %
-             (rule_gef_str, rule_ras_str),
+    r = Rule(rule_name,
              gef_pattern + ras_inactive >>
              gef_pattern + ras_active,
              kf_gef)
@@ -2086,20 +2125,24 @@ def gap_assemble_interactions_only(stmt, model, agent_set):
 
 
 def gap_assemble_one_step(stmt, model, agent_set):
-    gap_pattern = get_monomer_pattern(model, stmt.gap)
-    ras_inactive = get_monomer_pattern(model, stmt.ras,
+    # As in gef_assemble_one_step, check for an existing rule with this
+    # name before constructing any components
+    rule_gap_str = get_agent_rule_str(stmt.gap)
+    rule_ras_str = get_agent_rule_str(stmt.ras)
+    rule_name = '%s_deactivates_%s' % (rule_gap_str, rule_ras_str)
+    if model.rules.get(rule_name) is not None:
+        return
+    gap_pattern = get_cached_monomer_pattern(model, stmt.gap)
+    ras_inactive = get_cached_monomer_pattern(model, stmt.ras,
         extra_fields={'gtpbound': 'inactive'})
-    ras_active = get_monomer_pattern(model, stmt.ras,
+    ras_active = get_cached_monomer_pattern(model, stmt.ras,
         extra_fields={'gtpbound': 'active'})
 
     param_name = 'kf_' + stmt.gap.name[0].lower() + \
                     stmt.ras.name[0].lower() + '_gap'
     kf_gap = get_create_parameter(model, param_name, 1e-6)
 
-    rule_gap_str = get_agent_rule_str(stmt.gap)
-    rule_ras_str = get_agent_rule_str(stmt.ras)
-    r = Rule('%s_deactivates_%s' %
-             (rule_gap_str, rule_ras_str),
+    r = Rule(rule_name,
              gap_pattern + ras_active >>
              gap_pattern + ras_inactive,
              kf_gap)
@@ -1,4 +1,5 @@
 import os
+import weakref
 import itertools
 import numpy as np
 import networkx as nx
@@ -9,7 +10,14 @@ from indra import has_config
 logger = logging.getLogger('paths_graph')
 
 
-def get_reachable_sets(g, source, target, max_depth=10, signed=False):
+# Cached reachable sets, keyed by graph and then by the remaining
+# arguments to get_reachable_sets. Keying weakly by the graph object
+# lets the cached sets be garbage collected along with the graph.
+_reachable_sets_cache = weakref.WeakKeyDictionary()
+
+
+def get_reachable_sets(g, source, target, max_depth=10, signed=False,
+                       use_cache=False):
     """Get sets of nodes reachable from source and target at different depths.
 
     Parameters
@@ -26,6 +34,12 @@ def get_reachable_sets(g, source, target, max_depth=10, signed=False):
         Whether the graph is signed. If True, sign information should be encoded
         in the 'sign' field of the edge data, with 0 indicating a positive edge
         and 1 indicating a negative edge.
+    use_cache : Optional[boolean]
+        If True, the reachable sets are cached keyed by the graph and
+        the other arguments so that repeated queries against the same
+        graph skip the BFS. The cache is only valid as long as the graph
+        is not mutated between calls; callers that modify the graph
+        should leave this False (the default).
 
     Returns
     -------
@@ -40,6 +54,12 @@ def get_reachable_sets(g, source, target, max_depth=10, signed=False):
         respectively. Note that if the source or target are not reachable by
         any path within the given maximum depth, both dicts are empty.
     """
+    if use_cache:
+        graph_cache = _reachable_sets_cache.setdefault(g, {})
+        cache_key = (source, target, max_depth, signed)
+        cached = graph_cache.get(cache_key)
+        if cached is not None:
+            return cached
     # Forward and backward level sets for signed and unsigned graphs
     if signed:
         source = (source, 0)
@@ -91,7 +111,11 @@ def get_reachable_sets(g, source, target, max_depth=10, signed=False):
         # If we're going forward we make sure we visited the target
         if (direction == 'forward' and target not in visited) or \
            (direction == 'backward' and source not in visited):
+            if use_cache:
+                graph_cache[cache_key] = ({}, {})
             return ({}, {})
+    if use_cache:
+        graph_cache[cache_key] = (f_level, b_level)
     return (f_level, b_level)
 
 
@@ -367,6 +391,8 @@ class PathsGraph(object):
             for ix, v in enumerate(v_list):
                 weight_dict[(u, v)] = weights[ix]
         nx.set_edge_attributes(self.graph, 'weight', weight_dict)
+        # The cached successor distributions are based on the old weights
+        self._succ_cache = {}
 
     @staticmethod
     def _name_paths(paths):
@@ -435,15 +461,35 @@ class PathsGraph(object):
         return path
 
     def _successor(self, path, node):
-        out_edges = self.graph.out_edges(node, data=True)
-        # For determinism in testing
-        if has_config('TEST_FLAG'):
-            out_edges.sort()
-        weights = [t[2]['weight'] for t in out_edges]
-        # Normalize the weights to a proper probability distribution
-        p = np.array(weights) / np.sum(weights)
-        pred_idx = np.random.choice(len(out_edges), p=p)
-        return out_edges[pred_idx][1]
+        succ_nodes, p = self._get_successor_dist(node)
+        pred_idx = np.random.choice(len(succ_nodes), p=p)
+        return succ_nodes[pred_idx]
+
+    def _get_successor_dist(self, node):
+        """Get the successors of a node with their sampling probabilities.
+
+        Sampling many paths visits the same nodes over and over, so the
+        successor list and normalized weight array are computed once per
+        node and cached. The cache is invalidated when the edge weights
+        are changed via set_uniform_path_distribution.
+        """
+        try:
+            cache = self._succ_cache
+        except AttributeError:
+            cache = self._succ_cache = {}
+        dist = cache.get(node)
+        if dist is None:
+            out_edges = self.graph.out_edges(node, data=True)
+            # For determinism in testing
+            if has_config('TEST_FLAG'):
+                out_edges.sort()
+            weights = [t[2]['weight'] for t in out_edges]
+            # Normalize the weights to a proper probability distribution
+            p = np.array(weights) / np.sum(weights)
+            succ_nodes = [t[1] for t in out_edges]
+            dist = (succ_nodes, p)
+            cache[node] = dist
+        return dist
 
 
 class CombinedPathsGraph(object):
@@ -196,24 +196,21 @@ class PreCFPG(PathsGraph):
                     # (G_k, tags_k)
                     H_k = nx.DiGraph()
                     tags_k = {}
+                    # Merge the subgraphs and their tags in a single
+                    # pass over dic_X, accumulating the tag sets per
+                    # node, rather than checking every node of H_k for
+                    # membership in every subgraph
+                    tag_sets = {}
                     for x in X:
-                        h_x = dic_X[x][0]
+                        h_x, tags_x = dic_X[x]
                         H_k.add_edges_from(h_x.edges(data=True))
-                    # For every node in the combined subgraphs
+                        for v in h_x.nodes_iter():
+                            if v in tag_sets:
+                                tag_sets[v].update(tags_x[v])
+                            else:
+                                tag_sets[v] = set(tags_x[v])
                     for v in H_k.nodes_iter():
-                        # Create a set of tags...
-                        t = []
-                        # ...by iterating over every node at this level
-                        for x in X:
-                            # ...and checking to see if the node v in the
-                            # subgraph is in the history of a particular node x
-                            # at this level
-                            if v in dic_X[x][0]:
-                                # ...if so, add v to the list of tags for x
-                                tags_x = dic_X[x][1]
-                                t.extend(tags_x[v])
-                        t = list(set(t))
-                        tags_k[v] = t
+                        tags_k[v] = list(tag_sets[v])
                     dic_PG[k] = (H_k, tags_k)
             if not dic_PG[len(dic_PG)-1][0] or \
                set(dic_PG[0][0].edges()) == \
@@ -235,11 +232,27 @@ class PreCFPG(PathsGraph):
     def set_uniform_path_distribution():
         raise NotImplementedError()
 
+    def _get_tag_sets(self):
+        """Return the tags per node as sets for fast subset checks.
+
+        The tag lists are fixed once the pre-CFPG has been constructed,
+        so the set versions are built once and reused across all
+        sampling steps.
+        """
+        try:
+            return self._tag_sets
+        except AttributeError:
+            self._tag_sets = dict((node, set(tags))
+                                  for node, tags in self.tags.items())
+            return self._tag_sets
+
     def _successor(self, path, u):
         """Randomly choose a successor node of u given the current path."""
+        path_set = set(path)
+        tag_sets = self._get_tag_sets()
         out_edges = []
         for edge in self.graph.out_edges(u, data=True):
-            if set(path) <= set(self.tags[edge[1]]):
+            if path_set <= tag_sets[edge[1]]:
                 out_edges.append(edge)
         # If there are no admissible successors, raise a PathSamplingException
         if not out_edges:
@@ -325,18 +338,31 @@ def prune(pg, nodes_to_prune, source, target):
         return pg
     # Make a copy of the graph
     pg_pruned = pg.copy()
-    # Perform iterative pruning
+    # Remove the initial set of nodes
+    pg_pruned.remove_nodes_from(nodes_to_prune)
+    # Make a list of nodes whose in or out degree is now 0 (making
+    # sure to exclude the source and target, whose depths are at 0 and
+    # path_length, respectively)
+    no_in_edges = [node for node, in_deg in pg_pruned.in_degree_iter()
+                    if in_deg == 0 and node != source]
+    no_out_edges = [node for node, out_deg in pg_pruned.out_degree_iter()
+                    if out_deg == 0 and node != target]
+    nodes_to_prune = set(no_in_edges + no_out_edges)
+    # Continue pruning iteratively; after the first pass only the
+    # neighbors of just-removed nodes can newly drop to degree zero, so
+    # we check those instead of rescanning the degrees of every node in
+    # the graph on each iteration
     while nodes_to_prune:
-        # Remove the nodes in our pruning list
+        candidates = set()
+        for node in nodes_to_prune:
+            candidates.update(pg_pruned.predecessors(node))
+            candidates.update(pg_pruned.successors(node))
         pg_pruned.remove_nodes_from(nodes_to_prune)
-        # Make a list of nodes whose in or out degree is now 0 (making
-        # sure to exclude the source and target, whose depths are at 0 and
-        # path_length, respectively)
-        no_in_edges = [node for node, in_deg in pg_pruned.in_degree_iter()
-                        if in_deg == 0 and node != source]
-        no_out_edges = [node for node, out_deg in pg_pruned.out_degree_iter()
-                        if out_deg == 0 and node != target]
-        nodes_to_prune = set(no_in_edges + no_out_edges)
+        candidates -= nodes_to_prune
+        nodes_to_prune = set(
+            node for node in candidates
+            if (node != source and pg_pruned.in_degree(node) == 0) or
+               (node != target and pg_pruned.out_degree(node) == 0))
     return pg_pruned
 
 
@@ -12,7 +12,7 @@ import textwrap
 import xml.etree.ElementTree as ET
 import requests
 from time import sleep
-from indra import has_config, get_config
+from indra import has_config, get_config, config_dir
 # Python3
 try:
     from functools import lru_cache
@@ -21,6 +21,11 @@ except ImportError:
     from functools32 import lru_cache
 from indra.util import read_unicode_csv
 from indra.util import UnicodeXMLTreeBuilder as UTB
+# Optional dependency for caching HTTP responses on disk
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
 
 logger = logging.getLogger('elsevier')
 
@@ -62,6 +67,30 @@ if has_config(api_key_env_name):
     elsevier_keys['X-ELS-APIKey'] = get_config(api_key_env_name)
 
 
+_session = None
+
+
+def _get_session():
+    """Return the session through which Elsevier requests are made.
+
+    If the optional requests_cache package is installed, a CachedSession
+    backed by a sqlite database in the INDRA configuration folder is
+    created lazily on first use so that identical requests (e.g.
+    repeated downloads of the same article) are served from disk for a
+    day. Otherwise the requests module itself is returned, which exposes
+    the same get interface.
+    """
+    global _session
+    if _session is None:
+        if requests_cache is not None:
+            cache_name = os.path.join(config_dir, 'elsevier_cache')
+            _session = requests_cache.CachedSession(
+                cache_name, backend='sqlite', expire_after=86400)
+        else:
+            _session = requests
+    return _session
+
+
 def check_entitlement(doi):
     if elsevier_keys is None:
         logger.error('Missing API key, could not check article entitlement.')
@@ -70,7 +99,7 @@ def check_entitlement(doi):
         doi = doi[4:]
     url = '%s/%s' % (elsevier_entitlement_url, doi)
     params = {'httpAccept': 'text/xml'}
-    res = requests.get(url, params, headers=elsevier_keys)
+    res = _get_session().get(url, params, headers=elsevier_keys)
     if not res.status_code == 200:
         logger.error('Could not check entitlements for article %s: '
                      'status code %d' % (doi, res.status_code))
@@ -87,7 +116,7 @@ def download_article(id_val, id_type='doi', on_retry=False):
         id_type = 'pubmed_id'
     url = '%s/%s' % (elsevier_article_url_fmt % id_type, id_val)
     params = {'httpAccept': 'text/xml'}
-    res = requests.get(url, params, headers=elsevier_keys)
+    res = _get_session().get(url, params, headers=elsevier_keys)
     if res.status_code == 404:
         logger.debug("Resource for %s not available on elsevier."
                      % url)
@@ -282,7 +311,7 @@ def get_dois(query_str, count=100):
               'httpAccept': 'application/xml',
               'sort': '-coverdate',
               'field': 'doi'}
-    res = requests.get(url, params)
+    res = _get_session().get(url, params)
     if not res.status_code == 200:
         return None
     tree = ET.XML(res.content, parser=UTB())
@@ -132,11 +132,16 @@ import os
 import abc
 import sys
 import uuid
-import rdflib
 import logging
 from copy import deepcopy
 from collections import OrderedDict as _o
 from indra.util import unicode_strs
+# Python 3
+try:
+    from sys import intern as _intern
+# Python 2: interning unicode strings is not supported
+except ImportError:
+    _intern = None
 import indra.databases.hgnc_client as hgc
 import indra.databases.uniprot_client as upc
 
@@ -508,6 +513,11 @@ class Concept(object):
         Dictionary of database identifiers associated with this concept.
     """
     def __init__(self, name, db_refs=None):
+        # Interning makes equality checks between identical names a
+        # pointer comparison; the same gene names recur across many
+        # Concepts in a typical statement corpus
+        if _intern is not None and type(name) is str:
+            name = _intern(name)
         self.name = name
         self.db_refs = db_refs if db_refs else {}
 
@@ -831,28 +841,61 @@ class Agent(Concept):
         return True
 
     def equals(self, other):
-        matches = (self.name == other.name) and\
-                  (self.activity == other.activity) and \
-                  (self.location == other.location) and \
-                  (self.db_refs == other.db_refs)
-        if len(self.mods) == len(other.mods):
-            for s, o in zip(self.mods, other.mods):
-                matches = matches and s.equals(o)
-        else:
+        # Check the cheap scalar attributes first and return as soon as
+        # a mismatch is found rather than comparing every attribute.
+        if self.name != other.name:
             return False
-        if len(self.mutations) == len(other.mutations):
-            for s, o in zip(self.mutations, other.mutations):
-                matches = matches and s.equals(o)
-        else:
+        if self.activity != other.activity:
             return False
-        if len(self.bound_conditions) == len(other.bound_conditions):
-            for s, o in zip(self.bound_conditions, other.bound_conditions):
-                matches = matches and s.agent.equals(o.agent) and \
-                                      s.is_bound == o.is_bound
-        else:
+        if self.location != other.location:
+            return False
+        if len(self.mods) != len(other.mods) or \
+                len(self.mutations) != len(other.mutations) or \
+                len(self.bound_conditions) != len(other.bound_conditions):
             return False
+        if self.db_refs != other.db_refs:
+            return False
+        for s, o in zip(self.mods, other.mods):
+            if not s.equals(o):
+                return False
+        for s, o in zip(self.mutations, other.mutations):
+            if not s.equals(o):
+                return False
+        for s, o in zip(self.bound_conditions, other.bound_conditions):
+            if not s.agent.equals(o.agent) or s.is_bound != o.is_bound:
+                return False
+        return True
 
-        return matches
+    def get_hash(self, refresh=False):
+        """Return a hash of the Agent's matches_key.
+
+        The hash is computed on first use and cached since building the
+        matches_key string is relatively expensive.
+
+        Parameters
+        ----------
+        refresh : Optional[bool]
+            If True, the hash is recomputed even if a cached value is
+            available. This needs to be used if the Agent was changed
+            after the hash was first calculated. Default: False
+
+        Returns
+        -------
+        hash : int
+            The hash of the Agent's matches_key.
+        """
+        if refresh or getattr(self, '_hash', None) is None:
+            self._hash = hash(self.matches_key())
+        return self._hash
+
+    def __hash__(self):
+        # Note that __eq__ is not defined, so equality remains
+        # identity-based: putting Agents in a set or dict does not
+        # deduplicate matches()-equal Agents. Since Agents are mutated
+        # in many places, the cached hash can also go stale; call
+        # get_hash(refresh=True) after changing an Agent that is used
+        # as a set member or dict key.
+        return self.get_hash()
 
     def to_json(self):
         json_dict = _o({'name': self.name})
@@ -969,12 +1012,19 @@ class Evidence(object):
         return key
 
     def equals(self, other):
+        # Evidence objects are often shared across Statements, so check
+        # identity first before comparing the potentially large
+        # annotations and epistemics dicts
+        if self is other:
+            return True
         matches = (self.source_api == other.source_api) and\
                   (self.source_id == other.source_id) and\
                   (self.pmid == other.pmid) and\
                   (self.text == other.text) and\
-                  (self.annotations == other.annotations) and\
-                  (self.epistemics == other.epistemics)
+                  (self.annotations is other.annotations or
+                   self.annotations == other.annotations) and\
+                  (self.epistemics is other.epistemics or
+                   self.epistemics == other.epistemics)
         return matches
 
     def to_json(self):
@@ -1050,10 +1100,41 @@ class Statement(object):
         self.supported_by = supported_by if supported_by else []
         self.belief = 1
         self.uuid = '%s' % uuid.uuid4()
+        self._hash = None
 
     def matches(self, other):
         return self.matches_key() == other.matches_key()
 
+    def get_hash(self, refresh=False):
+        """Return a hash of the Statement's matches_key.
+
+        The hash is computed on first use and cached since building the
+        matches_key string is relatively expensive and the same value is
+        requested repeatedly, e.g. during deduplication.
+
+        Parameters
+        ----------
+        refresh : Optional[bool]
+            If True, the hash is recomputed even if a cached value is
+            available. This needs to be used if the Statement or its
+            Agents were changed after the hash was first calculated.
+            Default: False
+
+        Returns
+        -------
+        hash : int
+            The hash of the Statement's matches_key.
+        """
+        if refresh or getattr(self, '_hash', None) is None:
+            self._hash = hash(self.matches_key())
+        return self._hash
+
+    def __hash__(self):
+        # As with Agent, __eq__ is not defined, so equality remains
+        # identity-based and sets/dicts do not deduplicate
+        # matches()-equal Statements.
+        return self.get_hash()
+
     def agent_list_with_bound_condition_agents(self):
         # Returns the list of agents both directly participating in the
         # statement and referenced through bound conditions.
@@ -1094,8 +1175,18 @@ class Statement(object):
             return str(self).encode('utf-8')
 
     def equals(self, other):
+        if self is other:
+            return True
+        # Statements of different types are never equal; this also means
+        # sibling subclasses sharing attributes, e.g. Phosphorylation
+        # and Ubiquitination, cannot compare equal
+        if type(self) is not type(other):
+            return False
         if len(self.agent_list()) == len(other.agent_list()):
             for s, o in zip(self.agent_list(), other.agent_list()):
+                # Identical agent objects do not need to be compared
+                if s is o:
+                    continue
                 if (s is None and o is not None) or \
                    (s is not None and o is None):
                     return False
@@ -1302,10 +1393,10 @@ class Modification(Statement):
         return residue_matches and position_matches
 
     def equals(self, other):
-        matches = super(Modification, self).equals(other)
-        matches = (matches and (self.residue == other.residue)
-                   and (self.position == other.position))
-        return matches
+        if not super(Modification, self).equals(other):
+            return False
+        return (self.residue == other.residue and
+                self.position == other.position)
 
     def contradicts(self, other, hierarchies):
         # If the modifications are not the opposite polarity of the
@@ -1453,10 +1544,10 @@ class SelfModification(Statement):
         return residue_matches and position_matches
 
     def equals(self, other):
-        matches = super(SelfModification, self).equals(other)
-        matches = (matches and self.residue == other.residue
-                   and self.position == other.position)
-        return matches
+        if not super(SelfModification, self).equals(other):
+            return False
+        return (self.residue == other.residue and
+                self.position == other.position)
 
     def _get_mod_condition(self):
         """Return a ModCondition corresponding to this Modification."""
@@ -1782,10 +1873,10 @@ class RegulateActivity(Statement):
         return self.__str__()
 
     def equals(self, other):
-        matches = super(RegulateActivity, self).equals(other)
-        matches = (matches and self.obj_activity == other.obj_activity
-                   and self.is_activation == other.is_activation)
-        return matches
+        if not super(RegulateActivity, self).equals(other):
+            return False
+        return (self.obj_activity == other.obj_activity and
+                self.is_activation == other.is_activation)
 
     def _get_activity_condition(self):
         """Return ActivityCondition corresponding to this RegulateActivity."""
@@ -1994,10 +2085,10 @@ class ActiveForm(Statement):
         return s
 
     def equals(self, other):
-        matches = super(ActiveForm, self).equals(other)
-        matches = (matches and self.activity == other.activity
-                   and self.is_active == other.is_active)
-        return matches
+        if not super(ActiveForm, self).equals(other):
+            return False
+        return (self.activity == other.activity and
+                self.is_active == other.is_active)
 
 
 @python_2_unicode_compatible
@@ -2068,10 +2159,10 @@ class HasActivity(Statement):
         return s
 
     def equals(self, other):
-        matches = super(HasActivity, self).equals(other)
-        matches = (matches and self.activity == other.activity
-                   and self.has_activity == other.has_activity)
-        return matches
+        if not super(HasActivity, self).equals(other):
+            return False
+        return (self.activity == other.activity and
+                self.has_activity == other.has_activity)
 
 
 @python_2_unicode_compatible
@@ -2268,8 +2359,10 @@ class Complex(Statement):
         self.members = members
 
     def matches_key(self):
-        members = sorted(self.members, key=lambda x: x.matches_key())
-        key = (type(self), tuple(m.matches_key() for m in members))
+        # Sorting the member keys directly makes the key insensitive to
+        # member order and computes each member's key only once
+        key = (type(self), tuple(sorted(m.matches_key()
+                                        for m in self.members)))
         return str(key)
 
     def entities_match_key(self):
@@ -2385,10 +2478,10 @@ class Translocation(Statement):
         return (ref1 and ref2 and ref3)
 
     def equals(self, other):
-        matches = super(Translocation, self).equals(other)
-        matches = matches and (self.from_location == other.from_location)
-        matches = matches and (self.to_location == other.to_location)
-        return matches
+        if not super(Translocation, self).equals(other):
+            return False
+        return (self.from_location == other.from_location and
+                self.to_location == other.to_location)
 
     def matches_key(self):
         key = (type(self), self.agent.matches_key(), str(self.from_location),
@@ -2627,10 +2720,10 @@ class Influence(IncreaseAmount):
                 return True
             else:
                 return False
-        matches = super(Influence, self).equals(other) and \
-            delta_equals(self.subj_delta, other.subj_delta) and \
-            delta_equals(self.obj_delta, other.obj_delta)
-        return matches
+        if not super(Influence, self).equals(other):
+            return False
+        return (delta_equals(self.subj_delta, other.subj_delta) and
+                delta_equals(self.obj_delta, other.obj_delta))
 
     def matches_key(self):
         key = (type(self), self.subj.matches_key(),
@@ -2977,18 +3070,24 @@ def get_valid_location(location):
 
 
 def _read_activity_types():
-    """Read types of valid activities from a resource file."""
+    """Read types of valid activities from a resource file.
+
+    The resource file consists of simple N-Triples lines of the form
+    `<subject> <predicate> <object> .` which are parsed directly here;
+    this avoids importing rdflib, which is relatively slow to load,
+    every time this module is imported.
+    """
     this_dir = os.path.dirname(os.path.abspath(__file__))
     ac_file = os.path.abspath(this_dir + '/resources/activity_hierarchy.rdf')
-    g = rdflib.Graph()
-    with open(ac_file, 'r'):
-        g.parse(ac_file, format='nt')
     act_types = set()
-    for s, _, o in g:
-        subj = s.rpartition('/')[-1]
-        obj = o.rpartition('/')[-1]
-        act_types.add(subj)
-        act_types.add(obj)
+    with open(ac_file, 'r') as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            s, _, o = [t.strip('<>') for t in line.split()[:3]]
+            act_types.add(s.rpartition('/')[-1])
+            act_types.add(o.rpartition('/')[-1])
     return sorted(list(act_types))
 
 
@@ -3060,10 +3159,12 @@ modclass_to_modtype[Modification] = 'modification'
 modclass_to_modtype[Autophosphorylation] = 'phosphorylation'
 modclass_to_modtype[Transphosphorylation] = 'phosphorylation'
 
-# These are the modification types that are valid in ModConditions
-modtype_conditions = [modclass_to_modtype[mt] for mt in
-                      AddModification.__subclasses__()]
-modtype_conditions.append('modification')
+# These are the modification types that are valid in ModConditions; a
+# frozenset so that the validity check in ModCondition.__init__ is a
+# single hash lookup
+modtype_conditions = frozenset(
+    [modclass_to_modtype[mt] for mt in AddModification.__subclasses__()] +
+    ['modification'])
 
 
 def _get_mod_inverse_maps():
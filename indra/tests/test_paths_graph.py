@@ -85,6 +85,47 @@ def test_unreachability_signed():
     assert b_level == {}
 
 
+def test_get_reachable_sets_cached():
+    graph = nx.DiGraph()
+    graph.add_edges_from([('A', 'B'), ('B', 'D'), ('A', 'C'), ('C', 'D')])
+    f_level, b_level = get_reachable_sets(graph, source, target,
+                                          max_depth=2, use_cache=True)
+    assert f_level == {0: {'A'}, 1: {'B', 'C'}, 2: {'D'}}
+    assert b_level == {0: {'D'}, 1: {'B', 'C'}, 2: {'A'}}
+    # A second call with the same arguments should be served from the
+    # cache, returning the very same level dicts
+    f_level2, b_level2 = get_reachable_sets(graph, source, target,
+                                            max_depth=2, use_cache=True)
+    assert f_level2 is f_level
+    assert b_level2 is b_level
+
+
+def test_get_reachable_sets_cached_unreachable():
+    # Unreachable (empty) results should be cached as well
+    graph = nx.DiGraph()
+    graph.add_nodes_from(['A', 'B', 'C', 'D'])
+    graph.add_edges_from([('A', 'B'), ('D', 'B'), ('C', 'A'), ('C', 'D')])
+    for _ in range(2):
+        (f_level, b_level) = get_reachable_sets(graph, source, target,
+                                                max_depth=5, use_cache=True)
+        assert f_level == {}
+        assert b_level == {}
+
+
+def test_reachable_sets_cache_lifetime():
+    import gc
+    from indra.explanation.paths_graph.paths_graph import \
+        _reachable_sets_cache
+    graph = nx.DiGraph()
+    graph.add_edges_from([('A', 'B'), ('B', 'D')])
+    get_reachable_sets(graph, 'A', 'D', max_depth=2, use_cache=True)
+    assert graph in _reachable_sets_cache
+    # Cached entries should not outlive the graph they were computed for
+    del graph
+    gc.collect()
+    assert len(_reachable_sets_cache) == 0
+
+
 def test_from_graph_unsigned():
     # Path length 1
     f_level, b_level = get_reachable_sets(graph1_s, source, target, max_depth=3,
@@ -102,6 +102,25 @@ def test_matches_key_unicode3():
     assert unicode_strs(st2)
 
 
+def test_get_hash_refresh():
+    raf = Agent('Raf')
+    mek = Agent('Mek')
+    st = Phosphorylation(raf, mek)
+    hash1 = st.get_hash()
+    assert hash1 == hash(st.matches_key())
+    # Repeated calls return the cached value
+    assert st.get_hash() == hash1
+    # Mutating the Statement leaves the cached hash stale until a
+    # refresh is requested
+    st.residue = 'S'
+    assert st.get_hash() == hash1
+    hash2 = st.get_hash(refresh=True)
+    assert hash2 != hash1
+    assert hash2 == hash(st.matches_key())
+    # The refreshed value is now the cached one
+    assert st.get_hash() == hash2
+
+
 def test_matches2():
     raf = Agent('Raf')
     mek = Agent('Mek')
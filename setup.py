@@ -4,13 +4,14 @@ from setuptools import setup
 import sys
 
 def main():
-    # Only install functools32 if we're in Python 2 (it's not available
-    # for Python 3)
+    # Only install the functools32 and futures backports if we're in
+    # Python 2 (they're not available/needed for Python 3)
     install_list = ['pysb>=1.3.0', 'objectpath', 'rdflib==4.2.1',
                     'requests>=2.11', 'lxml', 'ipython', 'future',
                     'networkx==1.11', 'pandas']
     if sys.version_info[0] == 2:
         install_list.append('functools32')
+        install_list.append('futures')
 
     extras_require = {'machine': ['pytz', 'tzlocal', 'tweepy', 'ndex2',
                                   'pyyaml', 'click'],